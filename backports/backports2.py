@@ -6,15 +6,16 @@
 import sys
 
 
-# Built-ins `all` and `any` were added in Python 2.5.
-def all(iterable):
+# Built-ins `all` and `any` were added in Python 2.5. These pure Python
+# versions are only used as a fallback under Python 2.4.
+def _all_py(iterable):
     """all(iterable) -> bool
 
     Return True if bool(x) is True for all values x in the iterable.
 
-    >>> all([42, 23, 56, 12])
+    >>> _all_py([42, 23, 56, 12])
     True
-    >>> all([42, 23, 56, 0, 12])
+    >>> _all_py([42, 23, 56, 0, 12])
     False
 
     """
@@ -23,14 +24,14 @@ def all(iterable):
             return False
     return True
 
-def any(iterable):
+def _any_py(iterable):
     """any(iterable) -> bool
 
     Return True if bool(x) is True for any x in the iterable.
 
-    >>> any([0, False, None, {}])
+    >>> _any_py([0, False, None, {}])
     False
-    >>> any([0, False, None, 23, {}])
+    >>> _any_py([0, False, None, 23, {}])
     True
 
     """
@@ -39,9 +40,16 @@ def any(iterable):
             return True
     return False
 
+try:
+    # Prefer the much faster built-ins, which are implemented in C.
+    all, any = all, any
+except NameError:
+    # Python 2.4.
+    all, any = _all_py, _any_py
+
 
 # functools.wraps was added in Python 2.5.
-def wraps(func_to_wrap):
+def _wraps_py(func_to_wrap):
     """Return a decorator that wraps its argument.
 
     This is a reimplementation of functools.wraps() which copies the name,
@@ -54,7 +62,7 @@ def wraps(func_to_wrap):
     ...
     >>> undecorated.__module__ = 'parrot'
     >>> undecorated.attr = 'something'
-    >>> @wraps(undecorated)
+    >>> @_wraps_py(undecorated)
     ... def decorated(x):
     ...     return undecorated(x)
     ...
@@ -69,23 +77,36 @@ def wraps(func_to_wrap):
     >>> decorated.__name__
     'undecorated'
 
+    The decorated function is updated in place, rather than wrapped
+    inside another function:
+
+    >>> def f(): pass
+    >>> _wraps_py(undecorated)(f) is f
+    True
+
     """
     def decorator(func):
-        def f(*args, **kwargs):
-            return func(*args, **kwargs)
-        f.__doc__ = func_to_wrap.__doc__
+        # Like functools.wraps, update func in place rather than adding
+        # another layer of function call to every use of it.
+        func.__doc__ = func_to_wrap.__doc__
         try:
-            f.__name__ = func_to_wrap.__name__
+            func.__name__ = func_to_wrap.__name__
         except Exception:
             # Older versions of Python (2.3 and older perhaps?)
             # don't allow assigning to function __name__.
             pass
-        f.__module__ = func_to_wrap.__module__
+        func.__module__ = func_to_wrap.__module__
         if hasattr(func_to_wrap, '__dict__'):
-            f.__dict__.update(func_to_wrap.__dict__)
-        return f
+            func.__dict__.update(func_to_wrap.__dict__)
+        return func
     return decorator
 
+try:
+    from functools import wraps
+except ImportError:
+    # Python 2.4.
+    wraps = _wraps_py
+
 
 # sys.getsizeof added in Python 2.6.
 def getsizeof(obj, default=None):
@@ -105,37 +126,8 @@ def getsizeof(obj, default=None):
     over-allocation by lists and dicts.
     """
     T = type(obj)
-    if sys.version.startswith('2'):
-        byte_type = str
-        text_type = unicode
-    else:
-        byte_type = bytes
-        text_type = str
-    if T is int:
-        # This only applies before int/long unification.
-        kind = "fixed"
-        container = False
-        size = 4
-    elif T is list or T is tuple:
-        kind = "variable"
-        container = True
-        size = 4*len(obj)
-    elif T is dict:
-        kind = "variable"
-        container = True
-        size = 144
-        if len(obj) > 8:
-            size += 12*(len(obj)-8)
-    elif T is byte_type:
-        kind = "variable"
-        container = False
-        size = len(obj) + 1
-    elif T is text_type:
-        kind = "variable"
-        container = False
-        bytes_per_char = _get_bytes_per_char(obj)
-        size = bytes_per_char*(len(obj) + 1)
-    else:
+    sizer = _SIZERS.get(T)
+    if sizer is None:
         try:
             # FIXME The real sys.getsizeof implementation adds some
             # garbage collector overhead to this.
@@ -144,6 +136,45 @@ def getsizeof(obj, default=None):
             if default is None:
                 raise TypeError("don't know about '%s' objects" % T.__name__)
             return default
+    size, kind, container = sizer(obj)
+    return _finalize(size, kind, container)
+
+
+# Helper functions for getsizeof. Each returns the raw size of the object,
+# its kind ("fixed" or "variable"), and whether it is a container.
+
+def _size_int(obj):
+    # This only applies before int/long unification.
+    return 4, "fixed", False
+
+def _size_seq(obj):
+    return 4*len(obj), "variable", True
+
+def _size_dict(obj):
+    size = 144
+    if len(obj) > 8:
+        size += 12*(len(obj)-8)
+    return size, "variable", True
+
+def _size_bytes(obj):
+    return len(obj) + 1, "variable", False
+
+def _size_text(obj):
+    bytes_per_char = _get_bytes_per_char(obj)
+    return bytes_per_char*(len(obj) + 1), "variable", False
+
+_SIZERS = {int: _size_int, list: _size_seq, tuple: _size_seq,
+           dict: _size_dict}
+if sys.version.startswith('2'):
+    _SIZERS[str] = _size_bytes
+    _SIZERS[unicode] = _size_text
+else:
+    _SIZERS[bytes] = _size_bytes
+    _SIZERS[str] = _size_text
+
+
+def _finalize(size, kind, container):
+    # Add the object overhead to the raw size and round it up.
     assert kind in ("fixed", "variable")
     if kind == "fixed":
         overhead = 8
@@ -166,7 +197,7 @@ def getsizeof(obj, default=None):
 def _get_bytes_per_char(text):
     # Helper function determining the number of bytes per character
     # in text (Unicode) strings.
-    if sys.version >= '3.3':
+    if sys.version_info >= (3, 3):
         # Flexible text representation.
         if not text:
             return 1
@@ -186,6 +217,8 @@ def _get_bytes_per_char(text):
 
 
 # int.bit_length added in Python 2.7.
+_HAS_BIT_LENGTH = hasattr(int, 'bit_length')
+
 def bit_length(n):
     """Return the number of bits needed to represent int n in binary.
 
@@ -202,14 +235,18 @@ def bit_length(n):
     """
     if not isinstance(n, (int, long)):
         raise TypeError('expected an int')
+    if _HAS_BIT_LENGTH:
+        return n.bit_length()
     if n == 0:
         return 0
     elif n < 0:
         n = -n
     assert n >= 1
-    numbits = 0
-    while n > 2**64:
-        numbits += 64; n >>= 64
-    while n:
-        numbits += 1; n >>= 1
+    # Let the hex formatting do most of the work in C, so we only need
+    # to count the bits in the leading hex digit one at a time.
+    digits = '%x' % n
+    numbits = 4*(len(digits) - 1)
+    top = int(digits[0], 16)
+    while top:
+        numbits += 1; top >>= 1
     return numbits
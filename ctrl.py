@@ -4,8 +4,6 @@ try:
 except ImportError:
     from backports.nt import namedtuple
 
-from operator import attrgetter
-
 
 try:
     unichr
@@ -14,19 +12,6 @@ except NameError:
     unichr = chr
 
 
-if __debug__:
-    # This is only used to validate the codes when in debug mode.
-    def _code(num):
-        if 0 <= num <= 31:
-            return '^%c' % (ord('@') + num)
-        elif 128 <= num <= 159:
-            return 'ESC-%c' % (ord('@') + num - 128)
-        elif num == 127:
-            return '^?'
-        else:
-            return ''
-
-
 # Descriptions are mostly taken from the UnicodeData.txt file:
 #   http://www.unicode.org/Public/UNIDATA/UnicodeData.txt
 #
@@ -53,7 +38,7 @@ class CtrlCode(namedtuple('CtrlCode', 'acronym ordinal code description')):
 
 # === C0 control codes ===
 
-C0 = [
+_C0 = (
       # fields:  acronym, ordinal, code, description
       CtrlCode('NUL', 0,   '^@',  'Null'),
       CtrlCode('SOH', 1,   '^A',  'Start of Heading'),
@@ -91,15 +76,17 @@ C0 = [
       # but are commonly included, particularly Delete.
       CtrlCode('SP',  32,  '',    'Space'),
       CtrlCode('DEL', 127, '^?',  'Delete (Rubout)'),
-      ]
+      )
 
-C0 = dict((cc.acronym, cc) for cc in C0)
-assert len(C0) == 34
+C0 = dict((cc.acronym, cc) for cc in _C0)
+# Catch duplicate acronyms, which would silently overwrite each other.
+assert len(C0) == len(_C0) == 34
+del _C0
 
 
 # === C1 control codes ===
 
-C1 = [
+_C1 = (
       # fields:  acronym, ordinal, code, description
       CtrlCode('PAD',  128, 'ESC-@',  'Padding Character'),
       CtrlCode('HOP',  129, 'ESC-A',  'High Octet Preset'),
@@ -135,51 +122,85 @@ C1 = [
       CtrlCode('OSC',  157, 'ESC-]',  'Operating System Command'),
       CtrlCode('PM',   158, 'ESC-^',  'Privacy Message'),
       CtrlCode('APC',  159, 'ESC-_',  'Application Program Command'),
-      ]
-
-C1 = dict((cc.acronym, cc) for cc in C1)
-assert len(C1) == 32
-
-if __debug__:
-    # Check for duplicates. That's an error.
-    tmp = set(C0.keys()) & set(C1.keys())
-    assert not tmp, 'duplicate control code acronyms: %s' % tmp
-    # Special check for SCG abbreviated acronym.
-    assert 'SGC' not in C0
-    assert 'SGC' not in C1
-    # Validate that the ^ and ESC codes are correct.
-    for C in (C0, C1):
-        for cc in C.values():
-            assert cc.code == _code(cc.ordinal), 'failed check: %s' % cc
-    del C, cc, tmp
+      )
+
+C1 = dict((cc.acronym, cc) for cc in _C1)
+assert len(C1) == len(_C1) == 32
+del _C1
+
+# Tables mapping each way of looking up a control code to the code itself.
+_BY_ORDINAL = {}
+_BY_CODE = {}
+_BY_ACRONYM = {}
+for C in (C0, C1):
+    for cc in C.values():
+        _BY_ORDINAL[cc.ordinal] = cc
+        if cc.code:
+            _BY_CODE[cc.code] = cc
+        _BY_ACRONYM[cc.acronym] = cc
+del C, cc
+# Acronyms duplicated between C0 and C1 would overwrite each other.
+assert len(_BY_ACRONYM) == len(C0) + len(C1)
 
 
 def lookup(obj):
     if isinstance(obj, int):
-        f = attrgetter('ordinal')
+        table = _BY_ORDINAL
     elif isinstance(obj, str):
         if obj == '':
             return SP
         obj = obj.upper()
         if obj.startswith('^') or obj.startswith('ESC'):
-            f = attrgetter('code')
+            table = _BY_CODE
         else:
-            f = attrgetter('acronym')
+            table = _BY_ACRONYM
     else:
         raise TypeError('expected int or str, not %s' % type(obj).__name__)
-    for C in (C0, C1):
-        for c in C.values():
-            if f(c) == obj:
-                return c
-    raise LookupError
+    cc = table.get(obj)
+    if cc is None:
+        raise LookupError
+    return cc
+
+
+__all__ = ['lookup', 'C0', 'C1'] + list(C0) + list(C1)
 
 
-__all__ = ['lookup', 'C0', 'C1']
-__all__.extend(C0.keys())
-__all__.extend(C1.keys())
+# _BY_ACRONYM already merges C0 and C1, so update the globals just once.
+assert 'lookup' not in _BY_ACRONYM
+globals().update(_BY_ACRONYM)
 
 
-assert 'lookup' not in C0 and 'lookup' not in C1
-globals().update(C0)
-globals().update(C1)
+def _code(num):
+    # Return the expected ^ or ESC code for ordinal num.
+    if 0 <= num <= 31:
+        return '^%c' % (ord('@') + num)
+    elif 128 <= num <= 159:
+        return 'ESC-%c' % (ord('@') + num - 128)
+    elif num == 127:
+        return '^?'
+    else:
+        return ''
+
+
+def _selftest():
+    """Validate the control code tables.
+
+    This is too slow to run on every import. It runs when this module is
+    executed as a script, or with the doctests:
+
+    >>> _selftest()
+
+    Acronyms duplicated between C0 and C1 are already caught at import.
+    """
+    # Special check for SCG abbreviated acronym.
+    assert 'SGC' not in C0
+    assert 'SGC' not in C1
+    # Validate that the ^ and ESC codes are correct.
+    for C in (C0, C1):
+        for cc in C.values():
+            assert cc.code == _code(cc.ordinal), 'failed check: %s' % (cc,)
+
 
+if __name__ == '__main__':
+    _selftest()
+    print('control code tables are valid')
@@ -21,19 +21,18 @@ following features:
     >>> edir(k, 'dul')
     ['__module__']
 
-- Optionally filter out dunder methods with a keyword-only argument:
+- Optionally omit dunder names, or all names beginning with an
+  underscore, with a keyword-only argument:
 
-    >>> edir(k, dunders=False)
+    >>> edir(k, omit=1)
     ['aa', 'ab', 'ba', 'bb']
 
-- When running in the Python interactive interpreter, the dunder filter
-  is configurable by setting a flag on the ``edir`` object. You can
-  choose between "default on" and "default off":
+- When running in the Python interactive interpreter, the default for
+  ``omit`` is configurable by setting a flag on the ``edir`` object:
 
-    * If ``edir.dunders`` is missing or a true value, dunder methods
-      are returned by default;
-    * If ``edir.dunders`` is a false value, dunder methods are
-      suppressed by default.
+    * If ``edir.omit`` is missing, no names are omitted by default,
+      the same as the builtin ``dir``;
+    * Otherwise, ``edir.omit`` (0, 1 or 2) is used as the default.
 
   This intentionally only works in the interactive interpreter.
 
@@ -52,19 +51,13 @@ user's startup file.
 
 # Keep this module compatible with Python 2.4 and better.
 
+import re
 import sys
-from fnmatch import fnmatchcase
+from fnmatch import translate
 
 MISSING = object()
 original_dir = dir  # In case this gets monkey-patched.
 
-try:
-    any
-except NameError:
-    # Python 2.4 compatibility.
-    from backports import any
-
-
 # We prefer to do case-insensitive matching with Unicode string's casefold,
 # when it is available. Otherwise fall back to just lowercase.
 try:
@@ -73,6 +66,33 @@ except AttributeError:
     casefold = str.lower
 
 
+# Attribute names recur constantly from one call to the next, so cache
+# their casefolded versions. If the cache grows too big, it is cleared.
+_casefold_cache = {}
+_CASEFOLD_CACHE_SIZE = 4096
+
+def _casefold(s):
+    try:
+        return _casefold_cache[s]
+    except KeyError:
+        if len(_casefold_cache) >= _CASEFOLD_CACHE_SIZE:
+            _casefold_cache.clear()
+        result = _casefold_cache[s] = casefold(s)
+        return result
+
+
+def _isascii(names):
+    # Return True if all the names are known to be pure ASCII.
+    if casefold is str.lower:
+        # There's no casefold to worry about.
+        return True
+    try:
+        return ''.join(names).isascii()
+    except AttributeError:
+        # Python 3.6 and older.
+        return False
+
+
 def _interactive():
     return hasattr(sys, 'ps1')
 
@@ -81,32 +101,14 @@ def _ismagic(s):
     return s.startswith('_')
 
 
-def _isdunder(s):
-    D = '__'
-    return s.startswith(D) and s.endswith(D)
-
-
-def _pop(t, d=MISSING):
-    """Pop the first item from sequence t.
-
-    Returns both the first item and the tail of the sequence:
+# Test for dunder names with a compiled regex: its match method is a
+# single C call per name, faster than a Python function. This matches the
+# same names as s.startswith('__') and s.endswith('__'), including '___'.
+_isdunder = re.compile(r'__(?:.*__|_?)\Z', re.DOTALL).match
 
-    >>> t = (2, 3, 4, 5)
-    >>> item, t = _pop(t)
-    >>> print(item); print(t)
-    2
-    (3, 4, 5)
 
-    If t is empty, raises IndexError unless the option second
-    argument is given, in which case that it returned in place
-    of the non-existent popped value.
-    """
-    if t:
-        return t[0], t[1:]
-    elif d is not MISSING:
-        return d, ()
-    else:
-        raise IndexError('pop from empty object')
+# Built-in types can't be modified, so the attributes of type never change.
+_TYPE_NAMES = dir(type)
 
 
 def _getattrnames(obj, meta):
@@ -121,15 +123,86 @@ def _getattrnames(obj, meta):
             metaclass = type(obj)
         else:
             metaclass = type(type(obj))
-        names.extend(dir(metaclass))
-    return sorted(set(names))
+        if metaclass is type:
+            # By far the most common metaclass, and the only one we can
+            # cache.
+            names = names + _TYPE_NAMES
+        else:
+            names = names + dir(metaclass)
+    # dir() sorts the names, but doesn't remove duplicates returned by a
+    # custom __dir__. Where dicts keep insertion order, de-duplicating
+    # with a dict leaves the sorted run(s) intact, which are much quicker
+    # to sort than the arbitrary order of a set.
+    return sorted(dict.fromkeys(names))
 
 
-def _filter(names, glob):
-    # Filter names according to the glob.
+def _filter(names, glob, omit=0):
+    # Filter names according to the glob, and omit magic names, in a
+    # single pass over the names.
     assert isinstance(glob, str)
     if not glob:
-        return names
+        return _filter_magic(names, omit)
+    omitted = _magic_test(omit)
+    match, case_sensitive, substring = _compile_glob(glob)
+    if substring is not None:
+        # Plain substring searches are the common case. Test them inline
+        # rather than calling match for each name, then omit magic names
+        # from the (usually few) names left.
+        if case_sensitive:
+            names = [nm for nm in names if substring in nm]
+        elif _isascii(names):
+            # For ASCII, lower() gives the same result as casefold(), and
+            # calling the method inline is much faster than _casefold.
+            names = [nm for nm in names if substring in nm.lower()]
+        else:
+            names = [nm for nm in names if substring in _casefold(nm)]
+        if omitted is not None:
+            names = [nm for nm in names if not omitted(nm)]
+    elif omitted is None:
+        if case_sensitive:
+            names = list(filter(match, names))
+        else:
+            names = [nm for nm in names if match(_casefold(nm))]
+    elif case_sensitive:
+        names = [nm for nm in names if not omitted(nm) and match(nm)]
+    else:
+        names = [nm for nm in names
+                 if not omitted(nm) and match(_casefold(nm))]
+    return names
+
+
+def _hasmeta(glob):
+    # Return True if glob contains any glob metacharacters. Three plain
+    # substring tests are faster than any set operation on a short glob.
+    return '*' in glob or '?' in glob or '[' in glob
+
+
+# The same globs tend to be used repeatedly, so cache the result of
+# parsing them. If the cache grows too big, it is cleared.
+_glob_cache = {}
+_GLOB_CACHE_SIZE = 256
+
+def _compile_glob(glob):
+    """Return a match function, case-sensitivity flag and substring.
+
+    >>> match, case_sensitive, substring = _compile_glob('!=a*')
+    >>> bool(match('abc')), bool(match('Abc')), case_sensitive
+    (False, True, True)
+
+    If the glob is a plain substring search, the (casefolded if needed)
+    substring is returned, otherwise None:
+
+    >>> _compile_glob('Abc')[2]
+    'abc'
+    >>> print(_compile_glob('a*')[2])
+    None
+
+    """
+    try:
+        return _glob_cache[glob]
+    except KeyError:
+        pass
+    key = glob
     invert = case_sensitive = False
     if glob.startswith('!='):
         invert = case_sensitive = True
@@ -143,11 +216,14 @@ def _filter(names, glob):
     if not case_sensitive:
         glob = casefold(glob)
     match = _matcher(glob, invert)
-    if case_sensitive:
-        names = [nm for nm in names if match(nm)]
+    if invert or _hasmeta(glob):
+        substring = None
     else:
-        names = [nm for nm in names if match(casefold(nm))]
-    return names
+        substring = glob
+    if len(_glob_cache) >= _GLOB_CACHE_SIZE:
+        _glob_cache.clear()
+    result = _glob_cache[key] = (match, case_sensitive, substring)
+    return result
 
 
 def _matcher(glob, invert):
@@ -157,43 +233,62 @@ def _matcher(glob, invert):
     >>> type(f) is type(lambda: None)
     True
 
+    The match function returns a true value for matching names, and a
+    false value otherwise.
     """
-    if any(c in glob for c in '*?['):
-        # Searches with metacharacters use fnmatchcase.
+    if _hasmeta(glob):
+        # Searches with metacharacters use a case-sensitive regex, like
+        # fnmatchcase, but compiled once rather than looked up per name.
         # Don't use fnmatch since that is platform-dependent.
-        def match(name):
-            return fnmatchcase(name, glob)
+        regex_match = re.compile(translate(glob)).match
+        if invert:
+            def match(name, regex_match=regex_match):
+                return regex_match(name) is None
+        else:
+            # Use the C method directly, so that filtering with it
+            # needs no Python-level call per name.
+            match = regex_match
+    elif invert:
+        def match(name, glob=glob):
+            return glob not in name
     else:
-        def match(name):
+        def match(name, glob=glob):
             return glob in name
-    if invert:
-        orig = match
-        def match(name):
-            return not orig(name)
     return match
 
 
 def _filter_magic(names, omit):
     """Keep or omit magic (private and dunder) names.
 
-    >>> L = ['a', '_b', 'c_', '__d__']
+    >>> L = ['a', '_b', 'c_', '__d__', '__', '___', '__a_']
     >>> _filter_magic(L, 0)
-    ['a', '_b', 'c_', '__d__']
+    ['a', '_b', 'c_', '__d__', '__', '___', '__a_']
     >>> _filter_magic(L, 1)
-    ['a', '_b', 'c_']
+    ['a', '_b', 'c_', '__a_']
     >>> _filter_magic(L, 2)
     ['a', 'c_']
 
+    """
+    omitted = _magic_test(omit)
+    if omitted is None:
+        return names
+    return [nm for nm in names if not omitted(nm)]
+
+
+def _magic_test(omit):
+    """Return a test for the magic names to be omitted.
+
+    Returns None if no names are to be omitted.
     """
     if omit not in (0, 1, 2):
         raise ValueError('omit must be one of 0, 1 or 2')
     if omit == 2:
-        return [nm for nm in names if not _ismagic(nm)]
+        return _ismagic
     elif omit == 1:
-        return [nm for nm in names if not _isdunder(nm)]
+        return _isdunder
     else:
         assert omit == 0
-        return names
+        return None
 
 
 def edir(*args, **kwargs):
@@ -263,26 +358,18 @@ def edir(*args, **kwargs):
     If ``glob`` contains no metacharacters, a straight substring match
     is performed.
 
-    If keyword-only argument ``dunders`` is a false value, dunder names
-    like "__str__" are suppressed. If it is a true value (the usual
-    default), they are included. If not given, the default depends on
-    whether we are running in the interactive interpeter or not. In
-    interactive mode, the default is taken from ``edir.dunders`` if it
-    exists, and True otherwise; in non-interactive mode, ``edir.dunders``
-    is ignored and the default is always True.
-
     If keyword-only argument ``meta`` is a true value, attributes reachable
     from the object's metaclass will also be included. By default,
     metaclass attributes are not included.
 
     """
+    if len(args) > 2:
+        raise TypeError('too many arguments')
     obj = glob = MISSING
     if args:
-        obj, args = _pop(args)
-    if args:
-        glob, args = _pop(args, None)
-    if args:
-        raise TypeError('too many arguments')
+        obj = args[0]
+        if len(args) == 2:
+            glob = args[1]
     if glob is MISSING:
         glob = kwargs.pop('glob', '')
     meta = kwargs.pop('meta', False)
@@ -305,10 +392,15 @@ def edir(*args, **kwargs):
         # under some implementations such as Jython.
         # Note that calling builtin dir() won't work, because the locals it
         # sees will be those of *this* function, not the caller.
-        names = sorted(sys._getframe(1).f_locals)
+        names = list(sys._getframe(1).f_locals)
     else:
         names = _getattrnames(obj, meta)
-    names = _filter(names, glob)
-    names = _filter_magic(names, omit)
+    if glob or omit != 0:
+        # The common case of no filtering at all skips this entirely.
+        names = _filter(names, glob, omit)
+    if obj is MISSING:
+        # Filtering keeps the order of names, so sort afterwards, when
+        # there may be far fewer of them.
+        names.sort()
     return names
 
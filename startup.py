@@ -57,7 +57,10 @@ EBCDIC = 'cp500'
 try:
     reload
 except NameError:
-    from imp import reload
+    try:
+        from importlib import reload  # Python 3.4 and better.
+    except ImportError:
+        from imp import reload
 
 # And reduce.
 try:
@@ -99,7 +102,7 @@ except (AttributeError, NotImplementedError):
 else:
     try:
         from enhanced_dir import edir as dir
-        dir.dunders = False
+        dir.omit = 1  # Omit dunder names by default.
     except ImportError:
         print('*** warning: enhanced dir not available ***')
 
@@ -128,12 +131,15 @@ else:
 # Set the USE_LARGE_TRACEBACKS global to a true value to use large tracebacks.
 USE_LARGE_TRACEBACKS = False  # Default to standard tracebacks.
 def _set_tb_handler():
-    import cgitb
     std_handler = sys.excepthook or sys.__excepthook__
-    big_handler = cgitb.Hook(display=1, logdir=None, context=5, format='text')
+    big_handler = []  # Only import cgitb and create this when needed.
     def handler(etype, evalue, etb):
         if globals().get('USE_LARGE_TRACEBACKS'):
-            return big_handler(etype, evalue, etb)
+            if not big_handler:
+                import cgitb
+                big_handler.append(cgitb.Hook(display=1, logdir=None,
+                                              context=5, format='text'))
+            return big_handler[0](etype, evalue, etb)
         else:
             return std_handler(etype, evalue, etb)
     sys.excepthook = handler
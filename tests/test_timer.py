@@ -132,6 +132,17 @@ class Stopwatch_Tests(unittest.TestCase):
         # Check it again, to be sure it's no longer increasing.
         self.assertEqual(sw.total, 3*DELTA)
 
+    def test_snapshot_while_running(self):
+        # Test that snapshot reads the timer once, while running.
+        sw = Stopwatch(timer=mock_time, verbose=False)
+        sw.start()
+        self.assertEqual(tuple(sw.snapshot()), (DELTA, DELTA, 1, True))
+        sw.stop()
+        snap = sw.snapshot()
+        self.assertEqual(tuple(snap), (2*DELTA, 2*DELTA, 1, False))
+        self.assertEqual(snap.elapsed, sw.elapsed)
+        self.assertEqual(snap.total, sw.total)
+
     def test_report_method(self):
         # Test the report method is called when appropriate.
         reported = [False]
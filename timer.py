@@ -13,6 +13,12 @@ except ImportError:
             return lambda f: f
 
 
+try:
+    from collections import namedtuple
+except ImportError:
+    from backports.nt import namedtuple
+
+
 try:
     next
 except NameError:
@@ -21,6 +27,13 @@ except NameError:
         return it.next()
 
 
+# Bind the garbage collector functions once, since they are used every
+# time a Stopwatch starts and stops.
+_gc_isenabled = gc.isenabled
+_gc_enable = gc.enable
+_gc_disable = gc.disable
+
+
 def _set_gc_state(state):
     """Set the garbage collector state.
 
@@ -28,9 +41,16 @@ def _set_gc_state(state):
     the GC, and any false value other than None disables it.
     """
     if state:
-        gc.enable()
+        _gc_enable()
     elif state is not None:
-        gc.disable()
+        _gc_disable()
+
+
+_WARNING = ("elapsed time is very small; consider using timeit.Timer"
+            " for micro-timings of small code snippets\n")
+
+
+Snapshot = namedtuple('Snapshot', 'elapsed total count running')
 
 
 class Stopwatch(object):
@@ -75,7 +95,13 @@ class Stopwatch(object):
                         otherwise False.
         total           The total accumulated time.
 
+    To read them all at once, consistently and with only one call
+    to the timer function, use the ``snapshot`` method.
+
     """
+    # The default timer function, imported when first needed.
+    _default_timer = None
+
     def __init__(self, timer=None, verbose=True, cutoff=0.001, set_gc=None):
         """Initialise the Stopwatch instance.
 
@@ -109,7 +135,11 @@ class Stopwatch(object):
 
         """
         if timer is None:
-            from timeit import default_timer as timer
+            timer = self._default_timer
+            if timer is None:
+                from timeit import default_timer as timer
+                # Store it as a staticmethod so it is never bound to self.
+                type(self)._default_timer = staticmethod(timer)
         self.timer = timer
         self.verbose = verbose
         self.cutoff = cutoff
@@ -139,7 +169,7 @@ class Stopwatch(object):
         if not self._running:
             self._running = True
             self._count += 1
-            self._gcstate = gc.isenabled()
+            self._gcstate = _gc_isenabled()
             _set_gc_state(self.set_gc)
             self._start = self.timer()
 
@@ -152,14 +182,17 @@ class Stopwatch(object):
         methods if appropriate.
         """
         if self._running:
-            self._elapsed = self.timer() - self._start
-            self._total += self._elapsed
+            # Read the timer before doing anything else.
+            elapsed = self.timer() - self._start
+            self._elapsed = elapsed
+            self._total += elapsed
             _set_gc_state(self._gcstate)
             self._running = False
             del self._start
             del self._gcstate
             if self.verbose:
-                if self.cutoff is not None and self.elapsed < self.cutoff:
+                cutoff = self.cutoff
+                if cutoff is not None and elapsed < cutoff:
                     self.warn()
                 self.report()
 
@@ -168,27 +201,25 @@ class Stopwatch(object):
 
         Override this method to customize the reporting mechanism.
         """
-        print('time taken: %f seconds' % self.elapsed)
+        sys.stdout.write('time taken: %f seconds\n' % self.elapsed)
 
     def warn(self):
         """Warn on short elapsed times.
 
         Override this method to customize the warning mechanism.
         """
-        sys.stderr.write(
-            "elapsed time is very small; consider using timeit.Timer"
-            " for micro-timings of small code snippets\n"
-            )
+        sys.stderr.write(_WARNING)
 
     @property
     def running(self):
         """True if the timer is currently running, else False."""
-        return bool(self._running)
+        # _running is always a bool.
+        return self._running
 
     @property
     def elapsed(self):
         """Elapsed time for the latest timing."""
-        if self.running:
+        if self._running:
             return self.timer() - self._start
         else:
             return self._elapsed
@@ -196,8 +227,8 @@ class Stopwatch(object):
     @property
     def total(self):
         """Total accumulated time for all timings."""
-        if self.running:
-            return self._total + self.elapsed
+        if self._running:
+            return self._total + (self.timer() - self._start)
         else:
             return self._total
 
@@ -206,6 +237,26 @@ class Stopwatch(object):
         """Number of times the timer has been run."""
         return self._count
 
+    def snapshot(self):
+        """Return the elapsed, total, count and running values at once.
+
+        The timer function is read at most once, so this is cheaper than
+        reading the properties one at a time while the timer is running,
+        and the values are all consistent with each other.
+
+        >>> sw = Stopwatch(verbose=False)
+        >>> sw.snapshot()
+        Snapshot(elapsed=0.0, total=0.0, count=0, running=False)
+
+        """
+        if self._running:
+            elapsed = self.timer() - self._start
+            total = self._total + elapsed
+        else:
+            elapsed = self._elapsed
+            total = self._total
+        return Snapshot(elapsed, total, self._count, self._running)
+
     # Context manager special methods.
 
     def __enter__(self):
@@ -245,6 +296,10 @@ class Stopwatch(object):
 
         """
         stopwatch = cls()  # Use the defaults.
+        # Like the with statement, look up the special methods on the
+        # class, but do it just once rather than on every call.
+        enter = cls.__enter__
+        exit = cls.__exit__
 
         @wraps(function)
         def inner(*args, **kwargs):
@@ -258,8 +313,7 @@ class Stopwatch(object):
             # See PEP 343 for details:
             #   http://www.python.org/dev/peps/pep-0343/
 
-            exit = type(stopwatch).__exit__  # Don't call it yet.
-            value = type(stopwatch).__enter__(stopwatch)
+            enter(stopwatch)
             exc = True
             try:
                 try:
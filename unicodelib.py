@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import re
+import sys
 import unicodedata
 
 
@@ -29,7 +31,6 @@ except ValueError:
 # planes, i.e. U+0000, U+10000, U+20000, ... U+100000.
 UNICODE_PLANES = tuple([i << 16 for i in range(17)])
 assert len(UNICODE_PLANES) == 17
-assert all(n & 0xFFFF == 0 for n in UNICODE_PLANES)
 
 
 # Unicode noncharacters:
@@ -43,37 +44,69 @@ NONCHARACTERS = ''.join(
     [unichr(n*0x10000 + 0xFFFE +i) for n in range(17) for i in range(2)]
     )
 assert len(NONCHARACTERS) == 66
-assert list(NONCHARACTERS) == sorted(NONCHARACTERS)
+# For fast membership tests.
+_NONCHARACTER_SET = frozenset(NONCHARACTERS)
 
 
 def issurrogate(c):
-    """Return whether character c is a surrogate code point or not."""
-    if isinstance(s, unicode):
+    """Return whether character c is a surrogate code point or not.
+
+    >>> issurrogate(unichr(0xD800))
+    True
+    >>> issurrogate(unichr(0x61))
+    False
+
+    """
+    if isinstance(c, unicode):
         return 0xD800 <= ord(c) <= 0xDFFF
     raise TypeError('not a Unicode string')
 
 
+# Searching with a regex scans the string in C, rather than calling ord()
+# on each character in turn.
+_search_surrogate = re.compile(
+    '[%s-%s]' % (unichr(0xD800), unichr(0xDFFF))).search
+
+
 def isvalid(s):
     if isinstance(s, unicode):
-        return not any(0xD800 <= ord(c) <= 0xDFFF for c in s)
+        return _search_surrogate(s) is None
     raise TypeError('not a Unicode string')
 
 
+# str.isascii added in Python 3.7.
+_HAS_ISASCII = hasattr(unicode, 'isascii')
+
+# Characters compare in code point order, so the widths can be tested by
+# comparing against these directly, without calling ord().
+_MAX_ASCII = unichr(0x7F)
+_MAX_NARROW = unichr(0xFFFF)
+
 def characterise(text):
     if not isinstance(text, unicode):
         raise TypeError('not a Unicode string')
     if not text:
         return 'empty'
-    maxchr = ord(max(text))
-    if maxchr <= 0x7F:
+    # Try the cheap tests, which run in C, before scanning for the maximum.
+    if _HAS_ISASCII and text.isascii():
         return 'ascii'
-    elif maxchr <= 0xFF:
-        return 'latin1'
-    elif maxchr <= 0xFFFF:
-        return 'narrow'
+    try:
+        text.encode('latin-1')
+    except UnicodeEncodeError:
+        pass
     else:
-        assert maxchr <= 0x10FFFF
-        return 'wide'
+        if _HAS_ISASCII or max(text) > _MAX_ASCII:
+            return 'latin1'
+        return 'ascii'
+    # Not latin-1, so the text must be either narrow or wide.
+    if max(text) <= _MAX_NARROW:
+        return 'narrow'
+    return 'wide'
+
+
+# Code point label kinds for the categories of unnamed code points, apart
+# from Cn (unassigned) which may be either noncharacter or reserved.
+_LABEL_KINDS = {'Cc': 'control', 'Co': 'private-use', 'Cs': 'surrogate'}
 
 
 def charname(c):
@@ -85,18 +118,13 @@ def charname(c):
         number = ord(c)
         category = unicodedata.category(c)
         assert category in ('Cc', 'Cn', 'Co', 'Cs')
-        if category == 'Cc':
-            kind = 'control'
-        elif category == 'Cn':
-            if c in NONCHARACTERS:
+        if category == 'Cn':
+            if c in _NONCHARACTER_SET:
                 kind = 'noncharacter'
             else:
                 kind = 'reserved'
-        elif category == 'Co':
-            kind = 'private-use'
         else:
-            assert category == 'Cs'
-            kind = 'surrogate'
+            kind = _LABEL_KINDS[category]
         name = "<%s-%4X>" % (kind, number)
     return name
 
@@ -113,13 +141,20 @@ def codepoint(value):
     if isinstance(value, int):
         if not 0 <= value <= 0x10FFFF:
             raise ValueError('out of range 0...0x10FFFF')
-    elif not isinstance(text, unicode):
-        raise TypeError('not a Unicode string')
+    elif not isinstance(value, (str, unicode)):
+        raise TypeError('expected an int or a string')
     else:
         value = ord(value)
     return 'U+%04X' % value
 
 
+def _join_hex(template, ordinals):
+    # Format all the ordinals with a single % operation, rather than
+    # formatting each one separately and joining the pieces.
+    ordinals = tuple(ordinals)
+    return ' '.join([template]*len(ordinals)) % ordinals
+
+
 if sys.version < '3':
     def string_as_hex(s):
         """Convert str or unicode to hex.
@@ -131,13 +166,12 @@ if sys.version < '3':
 
         """
         if isinstance(s, unicode):
-            template = 'U+%04X'
+            template = '%04X'
         elif isinstance(s, str):
             template = '%02X'
         else:
             raise TypeError('argument must be str or unicode')
-        assert isinstance(s, basestr)
-        return ' '.join([template % ord(c) for c in s])
+        return _join_hex(template, map(ord, s))
 else:
     def string_as_hex(s):
         """Convert unicode or bytes to hex.
@@ -149,13 +183,12 @@ else:
 
         """
         if isinstance(s, str):
-            template = 'U+%04X'
+            return _join_hex('%04X', map(ord, s))
         elif isinstance(s, bytes):
-            template = '%02X'
+            # Iterating over bytes already gives ints.
+            return _join_hex('%02X', s)
         else:
             raise TypeError('argument must be str or bytes')
-        assert isinstance(s, (str, bytes))
-        return ' '.join([template % ord(c) for c in s])
 
 
 def compose(s, compat=False):
@@ -171,4 +204,19 @@ def decompose(s, compat=False):
     return unicodedata.normalize(form, s)
 
 
+def _selftest():
+    """Check the invariants of the module constants.
+
+    Only the cheap length checks are done at import time. The rest are
+    done here, when the doctests run or the module is run as a script:
+
+    >>> _selftest()
+
+    """
+    assert all(n & 0xFFFF == 0 for n in UNICODE_PLANES)
+    assert list(NONCHARACTERS) == sorted(NONCHARACTERS)
+
 
+if __name__ == '__main__':
+    _selftest()
+    print('unicodelib constants are valid')